@@ -7,7 +7,12 @@ import tempfile
 import time
 import traceback
 from functools import partial
-from typing import Callable
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+)
 
 import requests
 
@@ -16,19 +21,37 @@ from galaxy.util import DEFAULT_SOCKET_TIMEOUT
 from galaxy.util.sockets import get_ip
 
 GetIpCallable = Callable[[], str]
+# Seconds to wait between ``docker port`` attempts while the container is starting.
+PORTS_POLL_INTERVAL = 0.5
+
+
+def build_ports_command(container_name: str, connection_configuration: Dict[str, Any]) -> List[str]:
+    """Return the ``docker port`` argv for the monitored container.
+
+    ``sudo_cmd`` and ``docker_cmd`` may carry their own arguments (e.g.
+    ``/usr/bin/sudo -extra_param``), so they are split into separate tokens.
+    """
+    ports_command = []
+    if connection_configuration.get("sudo", docker_util.DEFAULT_SUDO):
+        ports_command.extend(shlex.split(connection_configuration.get("sudo_cmd", docker_util.DEFAULT_SUDO_COMMAND)))
+    ports_command.extend(shlex.split(connection_configuration.get("docker_cmd", docker_util.DEFAULT_DOCKER_COMMAND)))
+    host = connection_configuration.get("host", docker_util.DEFAULT_HOST)
+    if host:
+        ports_command.extend(["-H", host])
+    ports_command.extend(["port", container_name])
+    return ports_command
 
 
 def parse_ports(container_name, connection_configuration):
+    ports_command = build_ports_command(container_name, connection_configuration)
     while True:
-        ports_command = docker_util.build_docker_simple_command(
-            "port", container_name=container_name, **connection_configuration
-        )
         with tempfile.TemporaryFile(prefix="docker_port_") as stdout_file:
-            exit_code = subprocess.call(ports_command, shell=True, stdout=stdout_file, preexec_fn=os.setpgrp)
+            exit_code = subprocess.call(ports_command, stdout=stdout_file, preexec_fn=os.setpgrp)
             if exit_code == 0:
                 stdout_file.seek(0)
                 ports_raw = stdout_file.read().decode("utf-8")
                 return ports_raw
+        time.sleep(PORTS_POLL_INTERVAL)
 
 
 def get_ip_command(cmd) -> str:
@@ -45,6 +45,7 @@ log = getLogger(__name__)
 DOCKER_CONTAINER_TYPE = "docker"
 SINGULARITY_CONTAINER_TYPE = "singularity"
 TRAP_KILL_CONTAINER = "trap _on_exit EXIT"
+VOLUME_MODES = frozenset({"rw", "ro", "default_ro"})
 
 LOAD_CACHED_IMAGE_COMMAND_TEMPLATE = r"""
 python << EOF
@@ -209,7 +210,7 @@ class Volume:
             target = volume_parts[1]
             mode = volume_parts[2]
         elif len(volume_parts) == 2:
-            if volume_parts[1] not in ("rw", "ro", "default_ro"):
+            if volume_parts[1] not in VOLUME_MODES:
                 source = volume_parts[0]
                 target = volume_parts[1]
                 mode = "rw"
@@ -295,16 +296,19 @@ def preprocess_volumes(volumes_raw_str: str, container_type: str) -> List[str]:
         return []
 
     volumes = [Volume(v, container_type) for v in volumes_raw_str.split(",")]
-    rw_paths = [v.target for v in volumes if v.mode == "rw"]
-    for volume in volumes:
-        mode = volume.mode
-        if volume.mode == "default_ro":
-            mode = "ro"
-            if container_type == SINGULARITY_CONTAINER_TYPE:
-                for rw_path in rw_paths:
-                    if in_directory(rw_path, volume.target):
-                        mode = "rw"
-        volume.mode = mode
+    if container_type == SINGULARITY_CONTAINER_TYPE:
+        rw_paths = [v.target for v in volumes if v.mode == "rw"]
+        for volume in volumes:
+            if volume.mode == "default_ro":
+                if any(in_directory(rw_path, volume.target) for rw_path in rw_paths):
+                    volume.mode = "rw"
+                else:
+                    volume.mode = "ro"
+    else:
+        # Only Singularity needs the rw subdirectory check, for Docker default_ro is always ro.
+        for volume in volumes:
+            if volume.mode == "default_ro":
+                volume.mode = "ro"
 
     # remove duplicate targets
     target_to_volume = {v.target: str(v) for v in volumes}
@@ -401,16 +405,19 @@ class HasDockerLikeVolumes:
 
 class DockerContainer(Container, HasDockerLikeVolumes):
     container_type = DOCKER_CONTAINER_TYPE
+    _docker_host_props: Optional[Dict[str, Any]] = None
 
     @property
     def docker_host_props(self) -> Dict[str, Any]:
-        docker_host_props = dict(
-            docker_cmd=self.prop("cmd", docker_util.DEFAULT_DOCKER_COMMAND),
-            sudo=asbool(self.prop("sudo", docker_util.DEFAULT_SUDO)),
-            sudo_cmd=self.prop("sudo_cmd", docker_util.DEFAULT_SUDO_COMMAND),
-            host=self.prop("host", docker_util.DEFAULT_HOST),
-        )
-        return docker_host_props
+        # destination_info is fixed for the lifetime of the container, so resolve these once.
+        if self._docker_host_props is None:
+            self._docker_host_props = dict(
+                docker_cmd=self.prop("cmd", docker_util.DEFAULT_DOCKER_COMMAND),
+                sudo=asbool(self.prop("sudo", docker_util.DEFAULT_SUDO)),
+                sudo_cmd=self.prop("sudo_cmd", docker_util.DEFAULT_SUDO_COMMAND),
+                host=self.prop("host", docker_util.DEFAULT_HOST),
+            )
+        return self._docker_host_props
 
     @property
     def connection_configuration(self) -> Dict[str, Any]:
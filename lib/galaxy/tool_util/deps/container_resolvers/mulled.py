@@ -522,7 +522,7 @@ class CachedMulledDockerContainerResolver(CliContainerResolver):
             return None
 
         targets = mulled_targets(tool_info)
-        log.debug(f"Image name for tool {tool_info.tool_id}: {image_name(targets, self.hash_func)}")
+        _log_image_name(tool_info, targets, self.hash_func)
         resolution_cache = kwds.get("resolution_cache")
         return docker_cached_container_description(
             targets, self.namespace, hash_func=self.hash_func, shell=self.shell, resolution_cache=resolution_cache
@@ -543,7 +543,7 @@ class CachedMulledSingularityContainerResolver(SingularityCliContainerResolver):
             return None
 
         targets = mulled_targets(tool_info)
-        log.debug(f"Image name for tool {tool_info.tool_id}: {image_name(targets, self.hash_func)}")
+        _log_image_name(tool_info, targets, self.hash_func)
         return singularity_cached_container_description(
             targets, self.cache_directory, hash_func=self.hash_func, shell=self.shell
         )
@@ -612,7 +612,7 @@ class MulledDockerContainerResolver(CliContainerResolver):
             return None
 
         targets = mulled_targets(tool_info)
-        log.debug(f"Image name for tool {tool_info.tool_id}: {image_name(targets, self.hash_func)}")
+        _log_image_name(tool_info, targets, self.hash_func)
         if len(targets) == 0:
             return None
 
@@ -754,7 +754,7 @@ class BuildMulledDockerContainerResolver(CliContainerResolver):
             return None
 
         targets = mulled_targets(tool_info)
-        log.debug(f"Image name for tool {tool_info.tool_id}: {image_name(targets, self.hash_func)}")
+        _log_image_name(tool_info, targets, self.hash_func)
         if len(targets) == 0:
             return None
         if self.auto_install or install:
@@ -801,7 +801,7 @@ class BuildMulledSingularityContainerResolver(SingularityCliContainerResolver):
             return None
 
         targets = mulled_targets(tool_info)
-        log.debug(f"Image name for tool {tool_info.tool_id}: {image_name(targets, self.hash_func)}")
+        _log_image_name(tool_info, targets, self.hash_func)
         if len(targets) == 0:
             return None
 
@@ -819,6 +819,12 @@ def mulled_targets(tool_info: "ToolInfo") -> List[CondaTarget]:
     return requirements_to_mulled_targets(tool_info.requirements)
 
 
+def _log_image_name(tool_info: "ToolInfo", targets: List[CondaTarget], hash_func: Literal["v1", "v2"]) -> None:
+    # Computing the image name hashes the targets, so skip it unless the message will be emitted.
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(f"Image name for tool {tool_info.tool_id}: {image_name(targets, hash_func)}")
+
+
 def image_name(targets: List[CondaTarget], hash_func: Literal["v1", "v2"]) -> str:
     if len(targets) == 0:
         return "no targets"
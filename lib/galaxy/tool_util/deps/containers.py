@@ -1,6 +1,7 @@
 import collections
 import logging
 import os
+from functools import lru_cache
 from typing import (
     Any,
     Container as TypingContainer,
@@ -61,6 +62,14 @@ ResolvedContainerDescription = collections.namedtuple(
 )
 
 
+@lru_cache(maxsize=1)
+def _container_resolver_classes() -> Dict[str, Type["ContainerResolver"]]:
+    """Discover resolver plugins once rather than for every (destination) ContainerRegistry."""
+    import galaxy.tool_util.deps.container_resolvers
+
+    return plugin_config.plugins_dict(galaxy.tool_util.deps.container_resolvers, "resolver_type")
+
+
 class ContainerFinder:
     def __init__(self, app_info: "AppInfo", mulled_resolution_cache: Optional["Cache"] = None) -> None:
         self.app_info = app_info
@@ -105,12 +114,8 @@ class ContainerFinder:
                 self.app_info, destination_info=destination_info, mulled_resolution_cache=self.mulled_resolution_cache
             )
 
-        if (
-            destination_container_registry is None
-            and destination_id
-            and destination_id in self.destination_container_registeries
-        ):
-            destination_container_registry = self.destination_container_registeries[destination_id]
+        if destination_container_registry is None and destination_id:
+            destination_container_registry = self.destination_container_registeries.get(destination_id)
 
         return destination_container_registry or self.default_container_registry
 
@@ -134,7 +139,7 @@ class ContainerFinder:
             if container_description:
                 container_id = container_description.identifier
                 container_type = container_description.type
-            if container_type is None:
+            if container_type is None or container_type not in enabled_container_types:
                 return None
             else:
                 assert container_id
@@ -167,7 +172,7 @@ class ContainerFinder:
         # If destination forcing Galaxy to use a particular container do it,
         # this is likely kind of a corner case. For instance if deployers
         # do not trust the containers annotated in tools.
-        for container_type in CONTAINER_CLASSES.keys():
+        for container_type in enabled_container_types:
             container_id = self.__overridden_container_id(container_type, destination_info)
             if container_id:
                 container = __destination_container(container_type=container_type, container_id=container_id)
@@ -188,7 +193,7 @@ class ContainerFinder:
             if container:
                 return container
 
-        for container_type in CONTAINER_CLASSES.keys():
+        for container_type in enabled_container_types:
             container_id = self.__default_container_id(container_type, destination_info)
             if container_id:
                 container = __destination_container(container_type=container_type, container_id=container_id)
@@ -201,8 +206,6 @@ class ContainerFinder:
         return self.default_container_registry.get_resolution_cache()
 
     def __overridden_container_id(self, container_type: str, destination_info: Dict[str, Any]) -> Optional[str]:
-        if not self.__container_type_enabled(container_type, destination_info):
-            return None
         if f"{container_type}_container_id_override" in destination_info:
             return destination_info.get(f"{container_type}_container_id_override")
         if f"{container_type}_image_override" in destination_info:
@@ -227,8 +230,6 @@ class ContainerFinder:
         return cont_id
 
     def __default_container_id(self, container_type: str, destination_info: Dict[str, Any]) -> Optional[str]:
-        if not self.__container_type_enabled(container_type, destination_info):
-            return None
         key = f"{container_type}_default_container_id"
         # Also allow docker_image...
         if key not in destination_info:
@@ -249,9 +250,6 @@ class ContainerFinder:
         container_description: Optional[ContainerDescription] = None,
     ) -> Optional[Container]:
         # TODO: ensure destination_info is dict-like
-        if not self.__container_type_enabled(container_type, destination_info):
-            return None
-
         # TODO: Right now this assumes all containers available when a
         # container type is - there should be more thought put into this.
         # Checking which are available - settings policies for what can be
@@ -345,9 +343,7 @@ class ContainerRegistry:
         return default_resolvers
 
     def __resolvers_dict(self) -> Dict[str, Type["ContainerResolver"]]:
-        import galaxy.tool_util.deps.container_resolvers
-
-        return plugin_config.plugins_dict(galaxy.tool_util.deps.container_resolvers, "resolver_type")
+        return _container_resolver_classes()
 
     def get_resolution_cache(self) -> ResolutionCache:
         cache = ResolutionCache()
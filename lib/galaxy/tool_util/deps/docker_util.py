@@ -155,10 +155,7 @@ def build_docker_run_command(
         if set_user == DEFAULT_SET_USER:
             # If future-us is ever in here and fixing this for docker-machine just
             # use cwltool.docker_id - it takes care of this default nicely.
-            euid = os.geteuid()
-            egid = os.getgid()
-
-            user = "%d:%d" % (euid, egid)
+            user = f"{os.geteuid()}:{os.getgid()}"
         command_parts.extend(["--user", user])
     full_image = image
     if tag:
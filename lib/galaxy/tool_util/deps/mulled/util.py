@@ -7,6 +7,7 @@ import os
 import re
 import sys
 import threading
+from http.cookiejar import DefaultCookiePolicy
 from typing import (
     Any,
     Dict,
@@ -19,10 +20,11 @@ from typing import (
 )
 
 import requests
-from conda_package_streaming.package_streaming import stream_conda_info
-from conda_package_streaming.url import stream_conda_info as stream_conda_info_from_url
 from packaging.version import Version
-from requests import Session
+from requests import (
+    Response,
+    Session,
+)
 
 from galaxy.tool_util.deps.conda_util import CondaTarget
 from galaxy.tool_util.version import (
@@ -30,6 +32,11 @@ from galaxy.tool_util.version import (
     parse_version,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from galaxy.tool_util.deps.container_resolvers import ResolutionCache
 
@@ -42,6 +49,8 @@ QUAY_VERSIONS_CACHE_EXPIRY = 300
 NAMESPACE_HAS_REPO_NAME_KEY = "galaxy.tool_util.deps.container_resolvers.mulled.util:namespace_repo_names"
 TAG_CACHE_KEY = "galaxy.tool_util.deps.container_resolvers.mulled.util:tag_cache"
 
+_quay_sessions = threading.local()
+
 
 class PARSED_TAG(NamedTuple):
     tag: str
@@ -82,14 +91,32 @@ def quay_versions(namespace: str, pkg_name: str, session: Optional[Session] = No
     return [tag for tag in data["tags"].keys() if tag != "latest"]
 
 
+def _response_json(response: Response) -> Any:
+    """Decode a quay.io JSON response, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _get_quay_session() -> Session:
+    """Return a per-thread session so quay.io connections are reused without sharing a Session across threads."""
+    session = getattr(_quay_sessions, "session", None)
+    if session is None:
+        session = requests.session()
+        # Only connection reuse is wanted, don't carry cookies between unrelated quay.io calls.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _quay_sessions.session = session
+    return session
+
+
 def quay_repository(namespace: str, pkg_name: str, session: Optional[Session] = None) -> Dict[str, Any]:
     assert namespace is not None
     assert pkg_name is not None
     url = f"https://quay.io/api/v1/repository/{namespace}/{pkg_name}"
     if not session:
-        session = requests.session()
+        session = _get_quay_session()
     response = session.get(url, timeout=MULLED_SOCKET_TIMEOUT)
-    data = response.json()
+    data = _response_json(response)
     return data
 
 
@@ -103,7 +130,7 @@ def _get_namespace(namespace: str) -> List[str]:
         repos_response = requests.get(
             QUAY_REPOSITORY_API_ENDPOINT, headers=repos_headers, params=repos_parameters, timeout=MULLED_SOCKET_TIMEOUT
         )
-        repos_response_json = repos_response.json()
+        repos_response_json = _response_json(repos_response)
         repos = repos_response_json["repositories"]
         repo_names += [r["name"] for r in repos]
         next_page = repos_response_json.get("next_page")
@@ -390,6 +417,9 @@ def get_files_from_conda_package(url: str, filepaths: Iterable[str]) -> Dict[str
     >>> content_dict = get_files_from_conda_package("https://anaconda.org/conda-forge/chopin2/1.0.7/download/noarch/chopin2-1.0.7-pyhd8ed1ab_1.conda", ["info/about.json", "info/recipe/meta.yaml", "foo/bar"])
     >>> assert sorted(content_dict.keys()) == ["info/about.json", "info/recipe/meta.yaml"], content_dict
     """
+    # Imported here so that loading the container resolvers does not pay for conda_package_streaming.
+    from conda_package_streaming.package_streaming import stream_conda_info
+    from conda_package_streaming.url import stream_conda_info as stream_conda_info_from_url
 
     try:
         stream = stream_conda_info(url)
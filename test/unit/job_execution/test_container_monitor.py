@@ -0,0 +1,30 @@
+from galaxy.job_execution.container_monitor import build_ports_command
+
+
+def test_build_ports_command_defaults():
+    assert build_ports_command("abc", {}) == ["docker", "port", "abc"]
+
+
+def test_build_ports_command_splits_commands_with_arguments():
+    connection_configuration = dict(
+        docker_cmd="/usr/bin/docker --config /etc/docker",
+        sudo=True,
+        sudo_cmd="/usr/bin/sudo -extra_param",
+        host="tcp://dockerhost:2375",
+    )
+    assert build_ports_command("abc", connection_configuration) == [
+        "/usr/bin/sudo",
+        "-extra_param",
+        "/usr/bin/docker",
+        "--config",
+        "/etc/docker",
+        "-H",
+        "tcp://dockerhost:2375",
+        "port",
+        "abc",
+    ]
+
+
+def test_build_ports_command_without_sudo_ignores_sudo_cmd():
+    connection_configuration = dict(sudo=False, sudo_cmd="/usr/bin/sudo -extra_param")
+    assert build_ports_command("abc", connection_configuration) == ["docker", "port", "abc"]